@@ -1,30 +1,84 @@
 import os
-from flask import Flask, render_template_string, request, redirect, url_for, flash, session, jsonify
+import re
+import gzip
+import hashlib
+from flask import Flask, Response, abort, render_template, request, redirect, url_for, flash, session, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_bcrypt import Bcrypt
-from datetime import datetime, timedelta
 import sqlite3
 import requests
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import generate_password_hash, check_password_hash
 import atexit
 
 app = Flask(__name__)
+
+# Number of reverse proxies (e.g. nginx) in front of the app. Their
+# X-Forwarded-For entries are trusted so request.remote_addr is the real client;
+# leave at 0 when clients connect directly, or they could spoof the header
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES, x_proto=TRUSTED_PROXIES)
+
+# Use orjson for JSON responses and the status stream when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Get secret key from environment variable or use a fallback (change this in production!)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-please-change-me')
 
+# Every form and JSON body the app accepts is a few hundred bytes; anything
+# far larger is refused with 413 before it is read or parsed
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024
+
 bcrypt = Bcrypt(app)
 
 # Database setup - using absolute path
 DATABASE = os.path.join(os.path.dirname(__file__), 'uptime_monitor.db')
+# One connection per thread, opened on first use and kept for the thread's
+# lifetime so requests and monitor cycles skip the open and cache warmup
+db_local = threading.local()
+
 def get_db():
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(db_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE)
+        conn.row_factory = sqlite3.Row
+        # With WAL, fsync on checkpoints only; commits stay durable across crashes of the app
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        db_local.conn = conn
     return conn
 
+@app.teardown_appcontext
+def release_db(exc):
+    # A reused connection must not carry a half-done transaction into the next request
+    conn = getattr(db_local, 'conn', None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
 def init_db():
     with app.app_context():
         db = get_db()
+        # Append commits to a write-ahead log instead of rewriting pages in place,
+        # so readers are never blocked by the monitor thread's writes (persists in the file)
+        db.execute('PRAGMA journal_mode = WAL')
         # Users table
         db.execute('''
             CREATE TABLE IF NOT EXISTS users (
@@ -59,54 +113,244 @@ def init_db():
                 FOREIGN KEY (monitor_id) REFERENCES monitors (id)
             )
         ''')
+        # Every read of status_checks is per monitor and orders by id (newest
+        # first); this index serves those as range scans with no sort. It
+        # replaces the earlier (monitor_id, checked_at) index.
+        db.execute('DROP INDEX IF EXISTS idx_status_checks_monitor')
+        db.execute('''
+            CREATE INDEX IF NOT EXISTS idx_status_checks_monitor_id
+            ON status_checks (monitor_id, id)
+        ''')
         db.commit()
 
 init_db()
 
+# Monitor rows with their aggregated check statistics, shared by the
+# dashboard and the details page
+MONITOR_STATS_QUERY = '''
+    SELECT m.*,
+           (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 1) as up_count,
+           (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 0) as down_count,
+           (SELECT AVG(sc.response_time) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.response_time IS NOT NULL) as avg_response_time,
+           (SELECT COUNT(sc.response_time) FROM status_checks sc WHERE sc.monitor_id = m.id) as response_count,
+           (SELECT sc.is_up FROM status_checks sc WHERE sc.monitor_id = m.id ORDER BY sc.id DESC LIMIT 1) as last_status
+    FROM monitors m
+'''
+
+# Same columns for every monitor in one pass over status_checks, used to load
+# the snapshot at startup instead of running the correlated subqueries per monitor
+ALL_MONITOR_STATS_QUERY = '''
+    SELECT m.*, s.up_count, s.down_count, s.avg_response_time, s.response_count, sc.is_up as last_status
+    FROM monitors m
+    LEFT JOIN (
+        SELECT monitor_id,
+               SUM(is_up = 1) as up_count,
+               SUM(is_up = 0) as down_count,
+               AVG(response_time) as avg_response_time,
+               COUNT(response_time) as response_count,
+               MAX(id) as last_check_id
+        FROM status_checks
+        GROUP BY monitor_id
+    ) s ON s.monitor_id = m.id
+    LEFT JOIN status_checks sc ON sc.id = s.last_check_id
+'''
+
+# In-memory snapshot of every monitor and its stats. The monitor thread and the
+# routes that change monitors keep it current, so live updates never hit the DB.
+status_snapshot = {}
+snapshot_lock = threading.Lock()
+# Notified (under snapshot_lock) whenever snapshot_version moves, so status
+# streams wake on changes instead of polling
+snapshot_changed = threading.Condition(snapshot_lock)
+# Number of checks with a response time behind each monitor's average, so
+# new results can be folded into it without re-aggregating
+response_counts = {}
+# Bumped on every snapshot change so readers can tell when nothing moved
+snapshot_version = 0
+# Each monitor serialized on its own as (snapshot dict, json); a fragment is
+# current while its dict is still the one in the snapshot
+monitor_json = {}
+
+def refresh_snapshot(db, monitor_ids=None):
+    global snapshot_version
+    # Query and swap under the lock so record_checks() can never apply new
+    # results on top of rows read before those results were committed
+    with snapshot_lock:
+        snapshot_version += 1
+        if monitor_ids is None:
+            rows = db.execute(ALL_MONITOR_STATS_QUERY).fetchall()
+        else:
+            placeholders = ', '.join('?' * len(monitor_ids))
+            rows = db.execute(MONITOR_STATS_QUERY + f'WHERE m.id IN ({placeholders})',
+                              list(monitor_ids)).fetchall()
+            for monitor_id in monitor_ids:
+                status_snapshot.pop(monitor_id, None)
+                response_counts.pop(monitor_id, None)
+                monitor_json.pop(monitor_id, None)
+        for row in rows:
+            monitor = dict(row)
+            response_counts[monitor['id']] = monitor.pop('response_count') or 0
+            status_snapshot[monitor['id']] = monitor
+        snapshot_changed.notify_all()
+
+def record_checks(db, results):
+    global snapshot_version
+    # Store a cycle's (monitor_id, status_code, response_time, is_up, checked_at)
+    # results and update the snapshot stats incrementally
+    with snapshot_lock:
+        snapshot_version += 1
+        # Skip monitors deleted while their probe was in flight, so no orphan
+        # rows are left behind. Checked in the insert itself rather than against
+        # the snapshot, so deletes made through another worker count too.
+        db.executemany('''
+            INSERT INTO status_checks (monitor_id, status_code, response_time, is_up, checked_at)
+            SELECT ?1, ?2, ?3, ?4, ?5 WHERE EXISTS (SELECT 1 FROM monitors WHERE id = ?1)
+        ''', results)
+        db.commit()
+        for monitor_id, status_code, response_time, is_up, checked_at in results:
+            if monitor_id not in status_snapshot:
+                continue
+            # Replace rather than mutate: status streams diff against the dicts they last sent
+            monitor = dict(status_snapshot[monitor_id])
+            field = 'up_count' if is_up else 'down_count'
+            monitor[field] = (monitor[field] or 0) + 1
+            if response_time is not None:
+                count = response_counts.get(monitor_id, 0)
+                monitor['avg_response_time'] = ((monitor['avg_response_time'] or 0) * count + response_time) / (count + 1)
+                response_counts[monitor_id] = count + 1
+            monitor['last_status'] = is_up
+            status_snapshot[monitor_id] = monitor
+        snapshot_changed.notify_all()
+
+# Per-user monitor lists built from the snapshot, reused until it changes.
+# Entries are (snapshot version, monitors, revision), where revision is the
+# snapshot version at which this user's list last actually changed.
+user_status_cache = {}
+
+def get_user_status_revision(user_id):
+    with snapshot_lock:
+        cached = user_status_cache.get(user_id)
+        if cached is not None and cached[0] == snapshot_version:
+            return cached[1], cached[2]
+        monitors = [m for m in status_snapshot.values() if m['user_id'] == user_id]
+        version = snapshot_version
+    monitors.sort(key=lambda m: m['created_at'], reverse=True)
+    revision = version
+    # Snapshot dicts are replaced on change, so identity tells whether anything moved
+    if cached is not None and len(cached[1]) == len(monitors) and all(a is b for a, b in zip(cached[1], monitors)):
+        monitors, revision = cached[1], cached[2]
+    user_status_cache[user_id] = (version, monitors, revision)
+    return monitors, revision
+
+# Each user's monitor list serialized as (revision, json array), so every open
+# status stream of that user encodes it once per change
+user_status_json = {}
+
+def get_monitor_json(monitor):
+    cached = monitor_json.get(monitor['id'])
+    if cached is None or cached[0] is not monitor:
+        cached = monitor_json[monitor['id']] = (monitor, app.json.dumps(monitor))
+    return cached[1]
+
+def get_user_status_json(user_id, monitors, revision):
+    # Only monitors whose dicts were replaced since the last build are
+    # re-encoded; the rest reuse their fragments
+    cached = user_status_json.get(user_id)
+    if cached is None or cached[0] != revision:
+        body = '[' + ','.join(get_monitor_json(m) for m in monitors) + ']'
+        cached = user_status_json[user_id] = (revision, body)
+    return cached[1]
+
+refresh_snapshot(get_db())
+
 # Background monitoring thread
 monitoring_active = True
 monitor_thread = None
+# Set to run a monitoring cycle right away, e.g. to check a newly added monitor
+monitor_wakeup = threading.Event()
+
+# Concurrent probes per monitoring cycle
+PROBE_WORKERS = 16
+
+# One HTTP session for all probes so connections to each site are kept
+# alive and reused between checks instead of reconnecting every time
+http = requests.Session()
+# Checks are stateless: never store or send back cookies set by monitored sites
+http.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+# Keep pools for up to 100 hosts; the default of 10 evicts and reconnects
+# as soon as more than 10 distinct sites are monitored. Each host's pool holds
+# as many connections as there are probe workers, so none are discarded.
+for scheme in ('http://', 'https://'):
+    http.mount(scheme, requests.adapters.HTTPAdapter(pool_connections=100, pool_maxsize=PROBE_WORKERS))
+
+def probe_url(url):
+    # HEAD is enough to get the status code when it succeeds. Any error status
+    # is confirmed with a streamed GET (body never read), since some servers
+    # reject or mishandle HEAD (403, 404, 405, ...) yet serve GET normally;
+    # the GET's status is what gets recorded
+    response = http.head(url, timeout=10, allow_redirects=True)
+    if response.status_code >= 400:
+        response = http.get(url, timeout=10, stream=True)
+        response.close()
+    return response
+
+# Bounded pool for probes, so one slow or unreachable site does not hold up
+# the rest of the cycle
+probe_pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
+
+def check_monitor(monitor, checked_at):
+    # Result as a plain status_checks tuple
+    try:
+        start_time = time.time()
+        response = probe_url(monitor['url'])
+        response_time = time.time() - start_time
+        is_up = 1 if response.status_code < 400 else 0
+        return (monitor['id'], response.status_code, response_time, is_up, checked_at)
+    except Exception:
+        # Anything else (e.g. urllib3's LocationParseError for a malformed URL)
+        # is recorded as down too, so one bad monitor never loses the batch
+        return (monitor['id'], None, None, 0, checked_at)
 
 def monitor_websites():
     while monitoring_active:
+        # Sleep until the next monitor falls due, between 1 and 5 seconds
+        next_run = 5
         try:
             db = get_db()
-            current_time = datetime.now()
+            # One UTC timestamp per cycle, in the same format as CURRENT_TIMESTAMP
+            current_time = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
             
-            # Get all active monitors that need to be checked
-            monitors = db.execute('''
-                SELECT m.id, m.url, m.interval, MAX(sc.checked_at) as last_checked
+            # Active monitors with the age of their latest check. The database,
+            # not this process's snapshot, decides what is active and due, so
+            # edits, pauses and deletes made through any worker apply here and
+            # a check stored by another worker counts as done.
+            monitors = []
+            for monitor in db.execute('''
+                SELECT m.id, m.url, m.interval,
+                       (julianday(?) - julianday(sc.checked_at)) * 86400 as age
                 FROM monitors m
-                LEFT JOIN status_checks sc ON m.id = sc.monitor_id
+                LEFT JOIN status_checks sc
+                  ON sc.id = (SELECT MAX(id) FROM status_checks WHERE monitor_id = m.id)
                 WHERE m.is_active = 1
-                GROUP BY m.id
-                HAVING last_checked IS NULL OR 
-                       (julianday(?) - julianday(last_checked)) * 86400 >= m.interval
-            ''', (current_time,)).fetchall()
-            
-            for monitor in monitors:
-                try:
-                    start_time = time.time()
-                    response = requests.get(monitor['url'], timeout=10)
-                    response_time = time.time() - start_time
-                    is_up = 1 if response.status_code < 400 else 0
-                    
-                    db.execute('''
-                        INSERT INTO status_checks (monitor_id, status_code, response_time, is_up)
-                        VALUES (?, ?, ?, ?)
-                    ''', (monitor['id'], response.status_code, response_time, is_up))
-                    db.commit()
-                except requests.RequestException as e:
-                    db.execute('''
-                        INSERT INTO status_checks (monitor_id, status_code, response_time, is_up)
-                        VALUES (?, ?, ?, ?)
-                    ''', (monitor['id'], None, None, 0))
-                    db.commit()
-            
+            ''', (current_time,)):
+                if monitor['age'] is None or monitor['age'] >= monitor['interval']:
+                    monitors.append(monitor)
+                    next_run = min(next_run, monitor['interval'])
+                else:
+                    next_run = min(next_run, monitor['interval'] - monitor['age'])
+
+            # Probe due monitors concurrently and write the results in one batch per cycle
+            results = list(probe_pool.map(lambda monitor: check_monitor(monitor, current_time), monitors))
+
+            if results:
+                record_checks(db, results)
+
         except Exception as e:
             print(f"Monitoring error: {e}")
+            get_db().rollback()
         
-        time.sleep(5)  # Check every 5 seconds if any monitors need checking
+        monitor_wakeup.wait(max(next_run, 1))
+        monitor_wakeup.clear()
 
 def start_monitoring():
     global monitoring_active, monitor_thread
@@ -119,6 +363,7 @@ def start_monitoring():
 def stop_monitoring():
     global monitoring_active
     monitoring_active = False
+    monitor_wakeup.set()
 
 start_monitoring()
 
@@ -127,619 +372,1066 @@ atexit.register(stop_monitoring)
 
 # Routes
 @app.route('/')
-def home():
-    if 'user_id' not in session:
-        return redirect(url_for('login'))
-    return redirect(url_for('dashboard'))
-
-@app.route('/login', methods=['GET', 'POST'])
-def login():
-    if 'user_id' in session:
-        return redirect(url_for('dashboard'))
-    
-    if request.method == 'POST':
-        username = request.form['username']
-        password = request.form['password']
-        
-        db = get_db()
-        user = db.execute('SELECT * FROM users WHERE username = ?', (username,)).fetchone()
-        
-        if user and check_password_hash(user['password'], password):
-            session['user_id'] = user['id']
-            session['username'] = user['username']
-            flash('Logged in successfully!', 'success')
-            return redirect(url_for('dashboard'))
-        else:
-            flash('Invalid username or password', 'danger')
-    
-    return render_template_string('''
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>StormX - Login</title>
-            <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
-            <style>
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                    font-family: 'Montserrat', sans-serif;
-                }
-                body {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    height: 100vh;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    color: white;
-                }
-                .container {
-                    width: 100%;
-                    max-width: 400px;
-                    padding: 2rem;
-                    background: rgba(255, 255, 255, 0.1);
-                    backdrop-filter: blur(10px);
-                    border-radius: 15px;
-                    box-shadow: 0 25px 45px rgba(0, 0, 0, 0.1);
-                    border: 1px solid rgba(255, 255, 255, 0.2);
-                    animation: fadeIn 0.5s ease-in-out;
-                }
-                @keyframes fadeIn {
-                    from { opacity: 0; transform: translateY(20px); }
-                    to { opacity: 1; transform: translateY(0); }
-                }
-                h1 {
-                    text-align: center;
-                    margin-bottom: 2rem;
-                    font-weight: 600;
-                }
-                .form-group {
-                    margin-bottom: 1.5rem;
-                }
-                label {
-                    display: block;
-                    margin-bottom: 0.5rem;
-                    font-weight: 400;
-                }
-                input {
-                    width: 100%;
-                    padding: 0.8rem;
-                    border: none;
-                    border-radius: 5px;
-                    background: rgba(255, 255, 255, 0.2);
-                    color: white;
-                    font-size: 1rem;
-                }
-                input::placeholder {
-                    color: rgba(255, 255, 255, 0.7);
-                }
-                button {
-                    width: 100%;
-                    padding: 0.8rem;
-                    border: none;
-                    border-radius: 5px;
-                    background: white;
-                    color: #667eea;
-                    font-size: 1rem;
-                    font-weight: 600;
-                    cursor: pointer;
-                    transition: all 0.3s ease;
-                }
-                button:hover {
-                    background: rgba(255, 255, 255, 0.8);
-                    transform: translateY(-2px);
-                }
-                .links {
-                    margin-top: 1.5rem;
-                    text-align: center;
-                }
-                .links a {
-                    color: white;
-                    text-decoration: none;
-                    font-weight: 300;
-                    transition: all 0.3s ease;
-                }
-                .links a:hover {
-                    text-decoration: underline;
-                }
-                .alert {
-                    padding: 0.8rem;
-                    margin-bottom: 1.5rem;
-                    border-radius: 5px;
-                    text-align: center;
-                }
-                .alert-success {
-                    background: rgba(46, 204, 113, 0.2);
-                    border: 1px solid rgba(46, 204, 113, 0.3);
-                }
-                .alert-danger {
-                    background: rgba(231, 76, 60, 0.2);
-                    border: 1px solid rgba(231, 76, 60, 0.3);
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>StormX Login</h1>
-                
-                {% with messages = get_flashed_messages(with_categories=true) %}
-                    {% if messages %}
-                        {% for category, message in messages %}
-                            <div class="alert alert-{{ category }}">{{ message }}</div>
-                        {% endfor %}
-                    {% endif %}
-                {% endwith %}
-                
-                <form method="POST" action="{{ url_for('login') }}">
-                    <div class="form-group">
-                        <label for="username">Username</label>
-                        <input type="text" id="username" name="username" placeholder="Enter your username" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="password">Password</label>
-                        <input type="password" id="password" name="password" placeholder="Enter your password" required>
-                    </div>
-                    <button type="submit">Login</button>
-                </form>
-                <div class="links">
-                    <p>Don't have an account? <a href="{{ url_for('signup') }}">Sign up</a></p>
-                </div>
-            </div>
-        </body>
-        </html>
-    ''')
-
-@app.route('/signup', methods=['GET', 'POST'])
-def signup():
-    if 'user_id' in session:
-        return redirect(url_for('dashboard'))
-    
-    if request.method == 'POST':
-        username = request.form['username']
-        email = request.form['email']
-        password = request.form['password']
-        confirm_password = request.form['confirm_password']
-        
-        if password != confirm_password:
-            flash('Passwords do not match', 'danger')
-            return redirect(url_for('signup'))
-        
-        hashed_password = generate_password_hash(password)
-        
-        db = get_db()
-        try:
-            db.execute('INSERT INTO users (username, email, password) VALUES (?, ?, ?)',
-                      (username, email, hashed_password))
-            db.commit()
-            flash('Account created successfully! Please log in.', 'success')
-            return redirect(url_for('login'))
-        except sqlite3.IntegrityError:
-            flash('Username or email already exists', 'danger')
-    
-    return render_template_string('''
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>StormX - Sign Up</title>
-            <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
-            <style>
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                    font-family: 'Montserrat', sans-serif;
-                }
-                body {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    height: 100vh;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    color: white;
-                }
-                .container {
-                    width: 100%;
-                    max-width: 400px;
-                    padding: 2rem;
-                    background: rgba(255, 255, 255, 0.1);
-                    backdrop-filter: blur(10px);
-                    border-radius: 15px;
-                    box-shadow: 0 25px 45px rgba(0, 0, 0, 0.1);
-                    border: 1px solid rgba(255, 255, 255, 0.2);
-                    animation: fadeIn 0.5s ease-in-out;
-                }
-                @keyframes fadeIn {
-                    from { opacity: 0; transform: translateY(20px); }
-                    to { opacity: 1; transform: translateY(0); }
-                }
-                h1 {
-                    text-align: center;
-                    margin-bottom: 2rem;
-                    font-weight: 600;
-                }
-                .form-group {
-                    margin-bottom: 1.5rem;
-                }
-                label {
-                    display: block;
-                    margin-bottom: 0.5rem;
-                    font-weight: 400;
-                }
-                input {
-                    width: 100%;
-                    padding: 0.8rem;
-                    border: none;
-                    border-radius: 5px;
-                    background: rgba(255, 255, 255, 0.2);
-                    color: white;
-                    font-size: 1rem;
-                }
-                input::placeholder {
-                    color: rgba(255, 255, 255, 0.7);
-                }
-                button {
-                    width: 100%;
-                    padding: 0.8rem;
-                    border: none;
-                    border-radius: 5px;
-                    background: white;
-                    color: #667eea;
-                    font-size: 1rem;
-                    font-weight: 600;
-                    cursor: pointer;
-                    transition: all 0.3s ease;
-                }
-                button:hover {
-                    background: rgba(255, 255, 255, 0.8);
-                    transform: translateY(-2px);
-                }
-                .links {
-                    margin-top: 1.5rem;
-                    text-align: center;
-                }
-                .links a {
-                    color: white;
-                    text-decoration: none;
-                    font-weight: 300;
-                    transition: all 0.3s ease;
-                }
-                .links a:hover {
-                    text-decoration: underline;
-                }
-                .alert {
-                    padding: 0.8rem;
-                    margin-bottom: 1.5rem;
-                    border-radius: 5px;
-                    text-align: center;
-                }
-                .alert-success {
-                    background: rgba(46, 204, 113, 0.2);
-                    border: 1px solid rgba(46, 204, 113, 0.3);
-                }
-                .alert-danger {
-                    background: rgba(231, 76, 60, 0.2);
-                    border: 1px solid rgba(231, 76, 60, 0.3);
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>StormX Sign Up</h1>
-                
-                {% with messages = get_flashed_messages(with_categories=true) %}
-                    {% if messages %}
-                        {% for category, message in messages %}
-                            <div class="alert alert-{{ category }}">{{ message }}</div>
-                        {% endfor %}
-                    {% endif %}
-                {% endwith %}
-                
-                <form method="POST" action="{{ url_for('signup') }}">
-                    <div class="form-group">
-                        <label for="username">Username</label>
-                        <input type="text" id="username" name="username" placeholder="Choose a username" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="email">Email</label>
-                        <input type="email" id="email" name="email" placeholder="Enter your email" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="password">Password</label>
-                        <input type="password" id="password" name="password" placeholder="Create a password" required>
-                    </div>
-                    <div class="form-group">
-                        <label for="confirm_password">Confirm Password</label>
-                        <input type="password" id="confirm_password" name="confirm_password" placeholder="Confirm your password" required>
-                    </div>
-                    <button type="submit">Sign Up</button>
-                </form>
-                <div class="links">
-                    <p>Already have an account? <a href="{{ url_for('login') }}">Log in</a></p>
-                </div>
-            </div>
-        </body>
-        </html>
-    ''')
-
-@app.route('/dashboard')
-def dashboard():
-    if 'user_id' not in session:
-        return redirect(url_for('login'))
-    
-    db = get_db()
-    monitors = db.execute('''
-        SELECT m.*, 
-               (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 1) as up_count,
-               (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 0) as down_count,
-               (SELECT AVG(sc.response_time) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.response_time IS NOT NULL) as avg_response_time,
-               (SELECT sc.is_up FROM status_checks sc WHERE sc.monitor_id = m.id ORDER BY sc.checked_at DESC LIMIT 1) as last_status
-        FROM monitors m
-        WHERE m.user_id = ?
-        ORDER BY m.created_at DESC
-    ''', (session['user_id'],)).fetchall()
-    
-    return render_template_string('''
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>StormX - Dashboard</title>
-            <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
-            <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
-            <style>
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                    font-family: 'Montserrat', sans-serif;
-                }
-                body {
-                    background-color: #f5f7fa;
-                    color: #333;
-                }
-                .navbar {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 1rem 2rem;
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-                }
-                .logo {
-                    font-size: 1.8rem;
-                    font-weight: 700;
-                    background: linear-gradient(to right, #fff, #ddd);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                }
-                .nav-links {
-                    display: flex;
-                    gap: 1.5rem;
-                }
-                .nav-links a {
-                    color: white;
-                    text-decoration: none;
-                    font-weight: 500;
-                    transition: all 0.3s ease;
-                }
-                .nav-links a:hover {
-                    opacity: 0.8;
-                    transform: translateY(-2px);
-                }
-                .container {
-                    max-width: 1200px;
-                    margin: 2rem auto;
-                    padding: 0 2rem;
-                }
-                .header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-bottom: 2rem;
-                }
-                .header h1 {
-                    font-size: 2rem;
-                    color: #444;
-                }
-                .btn {
-                    padding: 0.6rem 1.2rem;
-                    border: none;
-                    border-radius: 5px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    font-weight: 600;
-                    cursor: pointer;
-                    transition: all 0.3s ease;
-                    text-decoration: none;
-                    display: inline-block;
-                }
-                .btn:hover {
-                    transform: translateY(-2px);
-                    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-                }
-                .btn-secondary {
-                    background: linear-gradient(135deg, #6c757d 0%, #495057 100%);
-                }
-                .btn-danger {
-                    background: linear-gradient(135deg, #dc3545 0%, #a71d2a 100%);
-                }
-                .btn-success {
-                    background: linear-gradient(135deg, #28a745 0%, #1e7e34 100%);
-                }
-                .monitors-grid {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-                    gap: 1.5rem;
-                }
-                .monitor-card {
-                    background: white;
-                    border-radius: 10px;
-                    box-shadow: 0 5px 15px rgba(0, 0, 0, 0.05);
-                    padding: 1.5rem;
-                    transition: all 0.3s ease;
-                }
-                .monitor-card:hover {
-                    transform: translateY(-5px);
-                    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-                }
-                .monitor-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-bottom: 1rem;
-                }
-                .monitor-name {
-                    font-weight: 600;
-                    font-size: 1.2rem;
-                    color: #444;
-                }
-                .monitor-status {
-                    display: inline-block;
-                    width: 12px;
-                    height: 12px;
-                    border-radius: 50%;
-                    margin-right: 0.5rem;
-                }
-                .status-up {
-                    background-color: #28a745;
-                    box-shadow: 0 0 10px rgba(40, 167, 69, 0.5);
-                    animation: pulse 2s infinite;
-                }
-                .status-down {
-                    background-color: #dc3545;
-                    box-shadow: 0 0 10px rgba(220, 53, 69, 0.5);
-                    animation: pulse 2s infinite;
-                }
-                @keyframes pulse {
-                    0% { transform: scale(0.95); }
-                    50% { transform: scale(1.05); }
-                    100% { transform: scale(0.95); }
-                }
-                .monitor-url {
-                    color: #6c757d;
-                    font-size: 0.9rem;
-                    margin-bottom: 1rem;
-                    word-break: break-all;
-                }
-                .monitor-stats {
-                    display: flex;
-                    justify-content: space-between;
-                    margin-bottom: 1rem;
-                }
-                .stat-item {
-                    text-align: center;
-                }
-                .stat-value {
-                    font-weight: 700;
-                    font-size: 1.2rem;
-                }
-                .stat-label {
-                    font-size: 0.8rem;
-                    color: #6c757d;
-                }
-                .monitor-actions {
-                    display: flex;
-                    gap: 0.5rem;
-                }
-                .monitor-actions .btn {
-                    padding: 0.4rem 0.8rem;
-                    font-size: 0.8rem;
-                }
-                .response-time {
-                    height: 5px;
-                    background: #e9ecef;
-                    border-radius: 5px;
-                    margin-top: 0.5rem;
-                    overflow: hidden;
-                }
-                .response-time-bar {
-                    height: 100%;
-                    background: linear-gradient(90deg, #4facfe 0%, #00f2fe 100%);
-                    border-radius: 5px;
-                    transition: width 0.5s ease;
-                }
-                .modal {
-                    display: none;
-                    position: fixed;
-                    top: 0;
-                    left: 0;
-                    width: 100%;
-                    height: 100%;
-                    background: rgba(0, 0, 0, 0.5);
-                    z-index: 1000;
-                    justify-content: center;
-                    align-items: center;
-                }
-                .modal-content {
-                    background: white;
-                    padding: 2rem;
-                    border-radius: 10px;
-                    width: 100%;
-                    max-width: 500px;
-                    box-shadow: 0 5px 25px rgba(0, 0, 0, 0.2);
-                    animation: fadeIn 0.3s ease-out;
-                }
-                .modal-header {
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    margin-bottom: 1.5rem;
-                }
-                .modal-title {
-                    font-size: 1.5rem;
-                    font-weight: 600;
-                }
-                .close-btn {
-                    font-size: 1.5rem;
-                    cursor: pointer;
-                    color: #6c757d;
-                }
-                .form-group {
-                    margin-bottom: 1.5rem;
-                }
-                .form-group label {
-                    display: block;
-                    margin-bottom: 0.5rem;
-                    font-weight: 500;
-                }
-                .form-group input {
-                    width: 100%;
-                    padding: 0.8rem;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    font-size: 1rem;
-                }
-                .modal-footer {
-                    display: flex;
-                    justify-content: flex-end;
-                    gap: 0.5rem;
-                    margin-top: 2rem;
-                }
-                .alert {
-                    padding: 1rem;
-                    margin-bottom: 1.5rem;
-                    border-radius: 5px;
-                }
-                .alert-success {
-                    background: rgba(40, 167, 69, 0.1);
-                    border: 1px solid rgba(40, 167, 69, 0.2);
-                    color: #28a745;
-                }
-                .alert-danger {
-                    background: rgba(220, 53, 69, 0.1);
-                    border: 1px solid rgba(220, 53, 69, 0.2);
-                    color: #dc3545;
-                }
-            </style>
+def home():
+    if 'user_id' not in session:
+        return redirect(url_for('login'))
+    return redirect(url_for('dashboard'))
+
+# Page templates are compiled once at import instead of on every request
+# (render_template_string parses and compiles its source each call).
+# Login and signup share one page; `signup` selects the form.
+AUTH_TEMPLATE = app.jinja_env.from_string('''
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>StormX - {% if signup %}Sign Up{% else %}Login{% endif %}</title>
+            <link rel="preconnect" href="https://fonts.googleapis.com">
+            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+            <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
+            <link href="{{ asset_url('auth.css') }}" rel="stylesheet">
         </head>
         <body>
+            <div class="container">
+                <h1>StormX {% if signup %}Sign Up{% else %}Login{% endif %}</h1>
+                
+                {% with messages = get_flashed_messages(with_categories=true) %}
+                    {% if messages %}
+                        {% for category, message in messages %}
+                            <div class="alert alert-{{ category }}">{{ message }}</div>
+                        {% endfor %}
+                    {% endif %}
+                {% endwith %}
+                
+                <form method="POST" action="{{ url_for('signup' if signup else 'login') }}">
+                    <div class="form-group">
+                        <label for="username">Username</label>
+                        <input type="text" id="username" name="username" placeholder="{% if signup %}Choose a{% else %}Enter your{% endif %} username" required>
+                    </div>
+                    {% if signup %}
+                        <div class="form-group">
+                            <label for="email">Email</label>
+                            <input type="email" id="email" name="email" placeholder="Enter your email" required>
+                        </div>
+                    {% endif %}
+                    <div class="form-group">
+                        <label for="password">Password</label>
+                        <input type="password" id="password" name="password" placeholder="{% if signup %}Create a{% else %}Enter your{% endif %} password" required>
+                    </div>
+                    {% if signup %}
+                        <div class="form-group">
+                            <label for="confirm_password">Confirm Password</label>
+                            <input type="password" id="confirm_password" name="confirm_password" placeholder="Confirm your password" required>
+                        </div>
+                        <button type="submit">Sign Up</button>
+                    {% else %}
+                        <button type="submit">Login</button>
+                    {% endif %}
+                </form>
+                <div class="links">
+                    {% if signup %}
+                        <p>Already have an account? <a href="{{ url_for('login') }}">Log in</a></p>
+                    {% else %}
+                        <p>Don't have an account? <a href="{{ url_for('signup') }}">Sign up</a></p>
+                    {% endif %}
+                </div>
+            </div>
+        </body>
+        </html>
+''')
+
+# Auth pages rendered without flashed messages are identical for every
+# visitor, so each variant is rendered and gzipped once and reused
+auth_page_cache = {}
+
+def render_auth_page(signup):
+    if '_flashes' in session:
+        return render_template(AUTH_TEMPLATE, signup=signup)
+    cached = auth_page_cache.get(signup)
+    if cached is None:
+        body = render_template(AUTH_TEMPLATE, signup=signup).encode()
+        cached = auth_page_cache[signup] = (body, gzip.compress(body, 9))
+    body, gzipped_body = cached
+    gzipped = request.accept_encodings['gzip'] > 0
+    response = Response(gzipped_body if gzipped else body, mimetype='text/html')
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+# Password KDF and its cost, pinned rather than left to werkzeug's default.
+# The parameters are stored in each hash, so raising them later only affects
+# new hashes while existing ones keep verifying.
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
+# Hash of a random password nobody knows, for login attempts on unknown users
+DUMMY_PASSWORD_HASH = generate_password_hash(os.urandom(16).hex(), method=PASSWORD_HASH_METHOD)
+
+# Per-IP token buckets for login and signup posts, checked before any password
+# hashing runs: a burst of AUTH_BURST attempts, then one more every 3 seconds.
+# Keyed on request.remote_addr, so set TRUSTED_PROXIES when behind a proxy.
+AUTH_BURST = 10
+AUTH_REFILL_PER_SECOND = 1 / 3
+auth_buckets = {}
+auth_buckets_lock = threading.Lock()
+# Buckets that have filled back up are forgotten at most once a minute
+AUTH_SWEEP_INTERVAL = 60
+auth_buckets_swept = time.monotonic()
+
+def take_auth_attempt():
+    global auth_buckets_swept
+    ip = request.remote_addr
+    now = time.monotonic()
+    with auth_buckets_lock:
+        tokens, last = auth_buckets.get(ip, (AUTH_BURST, now))
+        tokens = min(AUTH_BURST, tokens + (now - last) * AUTH_REFILL_PER_SECOND)
+        allowed = tokens >= 1
+        auth_buckets[ip] = (tokens - 1 if allowed else tokens, now)
+        if now - auth_buckets_swept >= AUTH_SWEEP_INTERVAL:
+            auth_buckets_swept = now
+            for key, (left, seen) in list(auth_buckets.items()):
+                if left + (now - seen) * AUTH_REFILL_PER_SECOND >= AUTH_BURST:
+                    del auth_buckets[key]
+    return allowed
+
+def too_many_attempts(signup):
+    flash('Too many attempts, please wait a moment and try again', 'danger')
+    return render_auth_page(signup), 429
+
+@app.route('/login', methods=['GET', 'POST'])
+def login():
+    if 'user_id' in session:
+        return redirect(url_for('dashboard'))
+    
+    if request.method == 'POST':
+        if not take_auth_attempt():
+            return too_many_attempts(signup=False)
+        username = request.form['username']
+        password = request.form['password']
+        
+        db = get_db()
+        user = db.execute('SELECT id, username, password FROM users WHERE username = ?', (username,)).fetchone()
+        
+        # Unknown usernames are checked against a dummy hash so both failure
+        # cases take the same time (check_password_hash compares in constant time)
+        password_hash = user['password'] if user else DUMMY_PASSWORD_HASH
+        if check_password_hash(password_hash, password) and user:
+            session['user_id'] = user['id']
+            session['username'] = user['username']
+            flash('Logged in successfully!', 'success')
+            return redirect(url_for('dashboard'))
+        else:
+            flash('Invalid username or password', 'danger')
+    
+    return render_auth_page(signup=False)
+
+@app.route('/signup', methods=['GET', 'POST'])
+def signup():
+    if 'user_id' in session:
+        return redirect(url_for('dashboard'))
+    
+    if request.method == 'POST':
+        if not take_auth_attempt():
+            return too_many_attempts(signup=True)
+        username = request.form['username']
+        email = request.form['email']
+        password = request.form['password']
+        confirm_password = request.form['confirm_password']
+        
+        if password != confirm_password:
+            flash('Passwords do not match', 'danger')
+            return redirect(url_for('signup'))
+        
+        hashed_password = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+        
+        db = get_db()
+        try:
+            db.execute('INSERT INTO users (username, email, password) VALUES (?, ?, ?)',
+                      (username, email, hashed_password))
+            db.commit()
+            flash('Account created successfully! Please log in.', 'success')
+            return redirect(url_for('login'))
+        except sqlite3.IntegrityError:
+            flash('Username or email already exists', 'danger')
+    
+    return render_auth_page(signup=True)
+
+# Stylesheets and scripts, served from /assets with a content hash in the URL
+# so browsers can cache them indefinitely
+AUTH_CSS = '''
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+    font-family: 'Montserrat', sans-serif;
+}
+body {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    height: 100vh;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    color: white;
+}
+.container {
+    width: 100%;
+    max-width: 400px;
+    padding: 2rem;
+    background: rgba(255, 255, 255, 0.1);
+    backdrop-filter: blur(10px);
+    border-radius: 15px;
+    box-shadow: 0 25px 45px rgba(0, 0, 0, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    animation: fadeIn 0.5s ease-in-out;
+}
+@keyframes fadeIn {
+    from { opacity: 0; transform: translate3d(0, 20px, 0); }
+    to { opacity: 1; transform: translate3d(0, 0, 0); }
+}
+h1 {
+    text-align: center;
+    margin-bottom: 2rem;
+    font-weight: 600;
+}
+.form-group {
+    margin-bottom: 1.5rem;
+}
+label {
+    display: block;
+    margin-bottom: 0.5rem;
+    font-weight: 400;
+}
+input {
+    width: 100%;
+    padding: 0.8rem;
+    border: none;
+    border-radius: 5px;
+    background: rgba(255, 255, 255, 0.2);
+    color: white;
+    font-size: 1rem;
+}
+input::placeholder {
+    color: rgba(255, 255, 255, 0.7);
+}
+button {
+    width: 100%;
+    padding: 0.8rem;
+    border: none;
+    border-radius: 5px;
+    background: white;
+    color: #667eea;
+    font-size: 1rem;
+    font-weight: 600;
+    cursor: pointer;
+    transition: transform 0.3s ease, opacity 0.3s ease;
+}
+button:hover {
+    opacity: 0.8;
+    transform: translateY(-2px);
+}
+.links {
+    margin-top: 1.5rem;
+    text-align: center;
+}
+.links a {
+    color: white;
+    text-decoration: none;
+    font-weight: 300;
+}
+.links a:hover {
+    text-decoration: underline;
+}
+.alert {
+    padding: 0.8rem;
+    margin-bottom: 1.5rem;
+    border-radius: 5px;
+    text-align: center;
+}
+.alert-success {
+    background: rgba(46, 204, 113, 0.2);
+    border: 1px solid rgba(46, 204, 113, 0.3);
+}
+.alert-danger {
+    background: rgba(231, 76, 60, 0.2);
+    border: 1px solid rgba(231, 76, 60, 0.3);
+}
+'''
+
+DASHBOARD_CSS = '''
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+    font-family: 'Montserrat', sans-serif;
+}
+body {
+    background-color: #f5f7fa;
+    color: #333;
+}
+.navbar {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1rem 2rem;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+}
+.logo {
+    font-size: 1.8rem;
+    font-weight: 700;
+    background: linear-gradient(to right, #fff, #ddd);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+}
+.nav-links {
+    display: flex;
+    gap: 1.5rem;
+}
+.nav-links a {
+    color: white;
+    text-decoration: none;
+    font-weight: 500;
+    transition: transform 0.3s ease, opacity 0.3s ease;
+}
+.nav-links a:hover {
+    opacity: 0.8;
+    transform: translateY(-2px);
+}
+.container {
+    max-width: 1200px;
+    margin: 2rem auto;
+    padding: 0 2rem;
+}
+.header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 2rem;
+}
+.header h1 {
+    font-size: 2rem;
+    color: #444;
+}
+.btn {
+    padding: 0.6rem 1.2rem;
+    border: none;
+    border-radius: 5px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    font-weight: 600;
+    cursor: pointer;
+    transition: transform 0.3s ease;
+    text-decoration: none;
+    display: inline-block;
+    position: relative;
+}
+/* Hover shadow lives on a pseudo-element so only opacity animates */
+.btn::after {
+    content: '';
+    position: absolute;
+    inset: 0;
+    border-radius: inherit;
+    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+    opacity: 0;
+    transition: opacity 0.3s ease;
+    pointer-events: none;
+}
+.btn:hover {
+    transform: translateY(-2px);
+}
+.btn:hover::after {
+    opacity: 1;
+}
+.btn-secondary {
+    background: linear-gradient(135deg, #6c757d 0%, #495057 100%);
+}
+.btn-danger {
+    background: linear-gradient(135deg, #dc3545 0%, #a71d2a 100%);
+}
+.btn-success {
+    background: linear-gradient(135deg, #28a745 0%, #1e7e34 100%);
+}
+.monitors-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 1.5rem;
+}
+.monitor-card {
+    background: white;
+    border-radius: 10px;
+    box-shadow: 0 5px 15px rgba(0, 0, 0, 0.05);
+    padding: 1.5rem;
+    transition: transform 0.3s ease;
+    position: relative;
+    /* Live updates inside a card never affect its siblings. No paint
+       containment: it would clip the hover shadow layer */
+    contain: layout style;
+}
+.monitor-card::after {
+    content: '';
+    position: absolute;
+    inset: 0;
+    border-radius: inherit;
+    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
+    opacity: 0;
+    transition: opacity 0.3s ease;
+    pointer-events: none;
+}
+.monitor-card:hover {
+    transform: translateY(-5px);
+}
+.monitor-card:hover::after {
+    opacity: 1;
+}
+.monitor-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+.monitor-name {
+    font-weight: 600;
+    font-size: 1.2rem;
+    color: #444;
+}
+.monitor-status {
+    display: inline-block;
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+    margin-right: 0.5rem;
+    will-change: transform;  /* pulses forever, keep it on its own layer */
+}
+.status-up {
+    background-color: #28a745;
+    box-shadow: 0 0 10px rgba(40, 167, 69, 0.5);
+    animation: pulse 2s infinite;
+}
+.status-down {
+    background-color: #dc3545;
+    box-shadow: 0 0 10px rgba(220, 53, 69, 0.5);
+    animation: pulse 2s infinite;
+}
+@keyframes fadeIn {
+    from { opacity: 0; transform: translate3d(0, 20px, 0); }
+    to { opacity: 1; transform: translate3d(0, 0, 0); }
+}
+@keyframes pulse {
+    0% { transform: scale3d(0.95, 0.95, 1); }
+    50% { transform: scale3d(1.05, 1.05, 1); }
+    100% { transform: scale3d(0.95, 0.95, 1); }
+}
+.monitor-url {
+    color: #6c757d;
+    font-size: 0.9rem;
+    margin-bottom: 1rem;
+    word-break: break-all;
+}
+.monitor-stats {
+    display: flex;
+    justify-content: space-between;
+    margin-bottom: 1rem;
+}
+.stat-item {
+    text-align: center;
+}
+.stat-value {
+    font-weight: 700;
+    font-size: 1.2rem;
+}
+.stat-label {
+    font-size: 0.8rem;
+    color: #6c757d;
+}
+.monitor-actions {
+    display: flex;
+    gap: 0.5rem;
+}
+.monitor-actions .btn {
+    padding: 0.4rem 0.8rem;
+    font-size: 0.8rem;
+}
+.response-time {
+    height: 5px;
+    background: #e9ecef;
+    border-radius: 5px;
+    margin-top: 0.5rem;
+    overflow: hidden;
+}
+.response-time-bar {
+    height: 100%;
+    background: linear-gradient(90deg, #4facfe 0%, #00f2fe 100%);
+    border-radius: 5px;
+    transition: width 0.5s ease;
+}
+.modal {
+    display: flex;
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0, 0, 0, 0.5);
+    z-index: 1000;
+    justify-content: center;
+    align-items: center;
+    transition: opacity 0.2s, visibility 0.2s;
+}
+/* Closed modals stay laid out but are not painted or hit-tested; visibility
+   flips only at the end of the fade, so the content fades out with the backdrop */
+.modal:not(.active) {
+    opacity: 0;
+    visibility: hidden;
+    pointer-events: none;
+}
+/* Blur what is behind the backdrop, and keep a compositor layer, only while
+   a modal is open */
+.modal.active {
+    backdrop-filter: blur(4px);
+    will-change: opacity;
+}
+.modal-content {
+    background: white;
+    padding: 2rem;
+    border-radius: 10px;
+    width: 100%;
+    max-width: 500px;
+    box-shadow: 0 5px 25px rgba(0, 0, 0, 0.2);
+    contain: layout style;
+}
+.modal.active .modal-content {
+    animation: fadeIn 0.3s ease-out;
+}
+.modal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1.5rem;
+}
+.modal-title {
+    font-size: 1.5rem;
+    font-weight: 600;
+}
+.close-btn {
+    font-size: 1.5rem;
+    cursor: pointer;
+    color: #6c757d;
+}
+.form-group {
+    margin-bottom: 1.5rem;
+}
+.form-group label {
+    display: block;
+    margin-bottom: 0.5rem;
+    font-weight: 500;
+}
+.form-group input {
+    width: 100%;
+    padding: 0.8rem;
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    font-size: 1rem;
+}
+.modal-footer {
+    display: flex;
+    justify-content: flex-end;
+    gap: 0.5rem;
+    margin-top: 2rem;
+}
+.alert {
+    padding: 1rem;
+    margin-bottom: 1.5rem;
+    border-radius: 5px;
+}
+.alert-success {
+    background: rgba(40, 167, 69, 0.1);
+    border: 1px solid rgba(40, 167, 69, 0.2);
+    color: #28a745;
+}
+.alert-danger {
+    background: rgba(220, 53, 69, 0.1);
+    border: 1px solid rgba(220, 53, 69, 0.2);
+    color: #dc3545;
+}
+.toast {
+    position: fixed;
+    bottom: 1.5rem;
+    right: 1.5rem;
+    padding: 0.75rem 1.25rem;
+    border-radius: 5px;
+    background: #dc3545;
+    color: white;
+    z-index: 1100;
+    pointer-events: none;
+    opacity: 0;
+    transform: translateY(20px);
+    transition: transform 0.2s, opacity 0.2s;
+    will-change: transform, opacity;
+}
+.toast.show {
+    opacity: 1;
+    transform: translateY(0);
+}
+.paused-anims *,
+.paused-anims *::before,
+.paused-anims *::after {
+    animation-play-state: paused !important;
+}
+'''
+
+DASHBOARD_JS = '''
+// DOM references, looked up once
+const urls = document.body.dataset;
+const monitorsGrid = document.querySelector('.monitors-grid');
+const addModal = document.getElementById('addModal');
+
+// The edit modal is mounted from its template the first time it is needed
+let editModal, editId, editName, editUrl, editInterval, editIsActive;
+function mountEditModal() {
+    editModal = document.getElementById('editModalTpl').content.firstElementChild.cloneNode(true);
+    document.body.appendChild(editModal);
+    editId = document.getElementById('edit_id');
+    editName = document.getElementById('edit_name');
+    editUrl = document.getElementById('edit_url');
+    editInterval = document.getElementById('edit_interval');
+    editIsActive = document.getElementById('edit_is_active');
+}
+
+// Modal functions
+function openModal(modal) {
+    modal.classList.add('active');
+}
+
+function closeModal(modal) {
+    modal.classList.remove('active');
+}
+
+// Edit monitor
+function editMonitor(card) {
+    if (!editModal) mountEditModal();
+    editId.value = card.dataset.monitorId;
+    editName.value = card.dataset.name;
+    editUrl.value = card.dataset.url;
+    editInterval.value = card.dataset.interval;
+    editIsActive.checked = card.dataset.active === '1';
+    openModal(editModal);
+}
+
+// Non-blocking error messages
+const toast = document.getElementById('toast');
+let toastTimer;
+function showToast(message) {
+    toast.textContent = message;
+    toast.classList.add('show');
+    clearTimeout(toastTimer);
+    toastTimer = setTimeout(() => toast.classList.remove('show'), 3000);
+}
+
+// Delete monitor
+function deleteMonitor(id) {
+    if (confirm('Are you sure you want to delete this monitor?')) {
+        fetch(urls.deleteUrl, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ id: id }),
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                removeCard(id);
+            } else {
+                showToast('Error deleting monitor');
+            }
+        });
+    }
+}
+
+// Toggle monitor active status. The server refreshes its snapshot on success,
+// so the status stream delivers the confirmed state without a /status fetch.
+function toggleMonitor(id, status) {
+    fetch(urls.toggleUrl, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ 
+            id: id,
+            is_active: status 
+        }),
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            setActive(cards.get(id), status);
+        } else {
+            showToast('Error updating monitor');
+        }
+    });
+}
+
+// Live status updates
+function formatResponseTime(value) {
+    return value ? value.toFixed(2) + 's' : '-';
+}
+
+// Cards keyed by monitor id, with the nodes each update touches
+const cards = new Map();
+
+function registerCard(card) {
+    const entry = {
+        card: card,
+        name: card.querySelector('[data-field="name"]'),
+        url: card.querySelector('[data-field="url"]'),
+        interval: card.querySelector('[data-field="interval"]'),
+        status: card.querySelector('[data-field="last_status"]'),
+        upCount: card.querySelector('[data-field="up_count"]'),
+        downCount: card.querySelector('[data-field="down_count"]'),
+        avgResponseTime: card.querySelector('[data-field="avg_response_time"]'),
+        responseTime: card.querySelector('.response-time'),
+        toggle: card.querySelector('button[data-action="toggle"]'),
+    };
+    cards.set(Number(card.dataset.monitorId), entry);
+    return entry;
+}
+
+document.querySelectorAll('.monitor-card').forEach(registerCard);
+
+// New cards are cloned from a pre-parsed skeleton; renderCard fills them in
+const cardTemplate = document.getElementById('cardTpl');
+
+function createCard(monitor) {
+    const card = cardTemplate.content.firstElementChild.cloneNode(true);
+    card.dataset.monitorId = monitor.id;
+    const details = card.querySelector('a.btn');
+    details.href = details.getAttribute('href').replace(/0$/, monitor.id);
+    return registerCard(card);
+}
+
+function removeCard(id) {
+    const entry = cards.get(id);
+    if (!entry) return;
+    entry.card.remove();
+    cards.delete(id);
+    if (cards.size === 0) {
+        location.reload();  // show the empty state
+    }
+}
+
+function setActive(entry, isActive) {
+    if (!entry || entry.card.dataset.active === String(isActive)) return;
+    entry.card.dataset.active = isActive;
+    entry.toggle.dataset.active = isActive ? 0 : 1;
+    entry.toggle.className = isActive ? 'btn btn-secondary' : 'btn btn-success';
+    entry.toggle.firstElementChild.className = isActive ? 'fas fa-pause' : 'fas fa-play';
+    entry.toggle.lastChild.textContent = isActive ? ' Pause' : ' Resume';
+}
+
+// Only write nodes whose value actually changed
+function setText(node, value) {
+    value = String(value);
+    if (node.textContent !== value) {
+        node.textContent = value;
+    }
+}
+
+function updateStatusGrid(data) {
+    if (!monitorsGrid) {
+        if (data.monitors.length) location.reload();  // leave the empty state
+        return;
+    }
+    const seen = new Set();
+    const fragment = document.createDocumentFragment();
+    data.monitors.forEach(monitor => {
+        let entry = cards.get(monitor.id);
+        if (!entry) {
+            entry = createCard(monitor);
+            fragment.appendChild(entry.card);
+        }
+        seen.add(monitor.id);
+        entry.monitor = monitor;
+        renderCard(entry, monitor);
+    });
+    if (fragment.childElementCount) {
+        monitorsGrid.prepend(fragment);
+    }
+    // Drop cards for monitors deleted elsewhere
+    Array.from(cards.keys()).forEach(id => {
+        if (!seen.has(id)) removeCard(id);
+    });
+}
+
+// Merge changed fields into the last full state of each card
+function applyDelta(data) {
+    data.monitors.forEach(delta => {
+        const entry = cards.get(delta.id);
+        if (!entry) return;
+        entry.monitor = Object.assign(entry.monitor || {}, delta);
+        renderCard(entry, entry.monitor);
+    });
+}
+
+function renderCard(entry, monitor) {
+    // Skip cards whose displayed values are unchanged since the last render
+    const key = monitor.up_count + '|' + monitor.down_count + '|' + monitor.avg_response_time
+        + '|' + monitor.last_status + '|' + monitor.is_active
+        + '|' + monitor.name + '|' + monitor.url + '|' + monitor.interval;
+    if (entry.renderKey === key) return;
+    entry.renderKey = key;
+    // Edits made in another tab or session arrive through the stream; the
+    // dataset copies are what the edit form is pre-filled from
+    if (entry.card.dataset.name !== monitor.name) entry.card.dataset.name = monitor.name;
+    if (entry.card.dataset.url !== monitor.url) entry.card.dataset.url = monitor.url;
+    if (entry.card.dataset.interval !== String(monitor.interval)) entry.card.dataset.interval = monitor.interval;
+    setText(entry.name, monitor.name);
+    setText(entry.url, monitor.url);
+    setText(entry.interval, monitor.interval + 's');
+    setText(entry.upCount, monitor.up_count || 0);
+    setText(entry.downCount, monitor.down_count || 0);
+    setText(entry.avgResponseTime, formatResponseTime(monitor.avg_response_time));
+    const statusClass = 'monitor-status ' + (monitor.last_status === 1 ? 'status-up' : 'status-down');
+    if (entry.status.className !== statusClass) {
+        entry.status.className = statusClass;
+    }
+    entry.responseTime.hidden = !monitor.avg_response_time;
+    const width = Math.min((monitor.avg_response_time || 0) * 100, 100) + '%';
+    if (entry.responseTime.firstElementChild.style.width !== width) {
+        entry.responseTime.firstElementChild.style.width = width;
+    }
+    setActive(entry, monitor.is_active);
+}
+
+// Apply at most one grid update per frame: the latest full payload, then
+// any deltas that arrived after it, in order
+let pendingStatus = null;
+let pendingDeltas = [];
+let frameRequested = false;
+function requestRender() {
+    if (frameRequested) return;
+    frameRequested = true;
+    requestAnimationFrame(() => {
+        frameRequested = false;
+        if (pendingStatus !== null) {
+            const latest = pendingStatus;
+            pendingStatus = null;
+            updateStatusGrid(latest);
+        }
+        const deltas = pendingDeltas;
+        pendingDeltas = [];
+        deltas.forEach(applyDelta);
+    });
+}
+
+function scheduleRender(data) {
+    pendingStatus = data;
+    pendingDeltas = [];  // superseded by the full payload
+    requestRender();
+}
+
+function scheduleDelta(data) {
+    pendingDeltas.push(data);
+    requestRender();
+}
+
+// One delegated listener for every card button
+if (monitorsGrid) {
+    monitorsGrid.addEventListener('click', event => {
+        const button = event.target.closest('button[data-action]');
+        if (!button) return;
+        const card = button.closest('.monitor-card');
+        const id = Number(card.dataset.monitorId);
+        if (button.dataset.action === 'edit') {
+            editMonitor(card);
+        } else if (button.dataset.action === 'delete') {
+            deleteMonitor(id);
+        } else if (button.dataset.action === 'toggle') {
+            toggleMonitor(id, Number(button.dataset.active));
+        }
+    });
+}
+
+// Page-level controls outside the grid (add button, modal close buttons)
+const pageActions = {
+    'open-add': () => openModal(addModal),
+    'close-add': () => closeModal(addModal),
+    'close-edit': () => closeModal(editModal),
+};
+document.addEventListener('click', event => {
+    const control = event.target.closest('[data-action]');
+    if (control && pageActions[control.dataset.action]) {
+        pageActions[control.dataset.action]();
+    }
+});
+
+let eventSource = null;
+function openStream() {
+    // Never leave an older stream running alongside the new one
+    closeStream();
+    eventSource = new EventSource(urls.streamUrl);
+    eventSource.onmessage = event => scheduleRender(JSON.parse(event.data));
+    eventSource.addEventListener('delta', event => scheduleDelta(JSON.parse(event.data)));
+}
+
+function closeStream() {
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+}
+
+// No network or animation work while the tab is in the background; the
+// stream's first frame after reopening is a full snapshot
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        closeStream();
+        document.body.classList.add('paused-anims');
+    } else {
+        document.body.classList.remove('paused-anims');
+        openStream();
+    }
+});
+
+// The stream's first frame is the full snapshot, so no /status request is
+// needed on load. A page opened in a background tab waits until it is shown.
+if (document.hidden) {
+    document.body.classList.add('paused-anims');
+} else {
+    openStream();
+}
+'''
+
+def minify_css(css):
+    # Drop comments and the whitespace around punctuation; spaces between
+    # selector parts and values are kept
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+def minify_js(js):
+    # Only indentation, blank lines and whole-line comments go; line breaks
+    # stay so automatic semicolon insertion behaves exactly as before
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+ASSETS = {
+    'auth.css': (minify_css(AUTH_CSS).encode(), 'text/css'),
+    'dashboard.css': (minify_css(DASHBOARD_CSS).encode(), 'text/css'),
+    'dashboard.js': (minify_js(DASHBOARD_JS).encode(), 'text/javascript'),
+}
+ASSET_VERSIONS = {name: hashlib.sha256(body).hexdigest()[:12] for name, (body, _) in ASSETS.items()}
+# Compressed once here so requests never pay for gzip
+ASSETS_GZIP = {name: gzip.compress(body, 9) for name, (body, _) in ASSETS.items()}
+
+@app.template_global()
+def asset_url(name):
+    return url_for('asset', name=name, v=ASSET_VERSIONS[name])
+
+@app.route('/assets/<name>')
+def asset(name):
+    if name not in ASSETS:
+        abort(404)
+    body, mimetype = ASSETS[name]
+    etag = ASSET_VERSIONS[name]
+    gzipped = request.accept_encodings['gzip'] > 0
+    if gzipped:
+        body = ASSETS_GZIP[name]
+        etag += '-gz'
+    response = Response(body, mimetype=mimetype)
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    # Revalidations (e.g. a forced reload) get a bodiless 304
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+DASHBOARD_TEMPLATE = app.jinja_env.from_string('''
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>StormX - Dashboard</title>
+            <link rel="preconnect" href="https://fonts.googleapis.com">
+            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+            <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+            <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
+            <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
+            <link href="{{ asset_url('dashboard.css') }}" rel="stylesheet">
+            <script src="{{ asset_url('dashboard.js') }}" defer></script>
+        </head>
+        <body data-stream-url="{{ url_for('status_updates') }}"
+              data-toggle-url="{{ url_for('toggle_monitor') }}" data-delete-url="{{ url_for('delete_monitor') }}">
+            {% macro monitor_card(monitor) %}
+            <div class="monitor-card" data-monitor-id="{{ monitor['id'] }}" data-name="{{ monitor['name'] }}" data-url="{{ monitor['url'] }}" data-interval="{{ monitor['interval'] }}" data-active="{{ monitor['is_active'] }}">
+                <div class="monitor-header">
+                    <div class="monitor-name">
+                        <span class="monitor-status {% if monitor['last_status'] == 1 %}status-up{% else %}status-down{% endif %}" data-field="last_status"></span>
+                        <span data-field="name">{{ monitor['name'] }}</span>
+                    </div>
+                    <div class="monitor-actions">
+                        <button class="btn btn-secondary" data-action="edit">
+                            <i class="fas fa-edit"></i>
+                        </button>
+                        <button class="btn btn-danger" data-action="delete">
+                            <i class="fas fa-trash"></i>
+                        </button>
+                    </div>
+                </div>
+                <div class="monitor-url" data-field="url">{{ monitor['url'] }}</div>
+                
+                <div class="monitor-stats">
+                    <div class="stat-item">
+                        <div class="stat-value" data-field="up_count">{{ monitor['up_count'] or 0 }}</div>
+                        <div class="stat-label">UP</div>
+                    </div>
+                    <div class="stat-item">
+                        <div class="stat-value" data-field="down_count">{{ monitor['down_count'] or 0 }}</div>
+                        <div class="stat-label">DOWN</div>
+                    </div>
+                    <div class="stat-item">
+                        <div class="stat-value" data-field="avg_response_time">
+                            {% if monitor['avg_response_time'] %}
+                                {{ "%.2f"|format(monitor['avg_response_time']) }}s
+                            {% else %}
+                                -
+                            {% endif %}
+                        </div>
+                        <div class="stat-label">Avg. Response</div>
+                    </div>
+                    <div class="stat-item">
+                        <div class="stat-value" data-field="interval">{{ monitor['interval'] }}s</div>
+                        <div class="stat-label">Interval</div>
+                    </div>
+                </div>
+                
+                <div class="response-time" {% if not monitor['avg_response_time'] %}hidden{% endif %}>
+                    <div class="response-time-bar" style="width: {{ [(monitor['avg_response_time'] or 0) * 100, 100]|min }}%"></div>
+                </div>
+                
+                <div class="monitor-actions">
+                    {% if monitor['is_active'] %}
+                        <button class="btn btn-secondary" data-action="toggle" data-active="0">
+                            <i class="fas fa-pause"></i> Pause
+                        </button>
+                    {% else %}
+                        <button class="btn btn-success" data-action="toggle" data-active="1">
+                            <i class="fas fa-play"></i> Resume
+                        </button>
+                    {% endif %}
+                    <a href="{{ url_for('monitor_details', monitor_id=monitor['id']) }}" class="btn">
+                        <i class="fas fa-chart-line"></i> Details
+                    </a>
+                </div>
+            </div>
+            {% endmacro %}
+            
             <nav class="navbar">
                 <div class="logo">StormX Up</div>
                 <div class="nav-links">
@@ -751,7 +1443,7 @@ def dashboard():
             <div class="container">
                 <div class="header">
                     <h1>Website Monitors</h1>
-                    <button class="btn" onclick="openAddModal()"><i class="fas fa-plus"></i> Add Monitor</button>
+                    <button class="btn" data-action="open-add"><i class="fas fa-plus"></i> Add Monitor</button>
                 </div>
                 
                 {% with messages = get_flashed_messages(with_categories=true) %}
@@ -765,86 +1457,29 @@ def dashboard():
                 {% if monitors %}
                     <div class="monitors-grid">
                         {% for monitor in monitors %}
-                            <div class="monitor-card">
-                                <div class="monitor-header">
-                                    <div class="monitor-name">
-                                        <span class="monitor-status {% if monitor['last_status'] == 1 %}status-up{% else %}status-down{% endif %}"></span>
-                                        {{ monitor['name'] }}
-                                    </div>
-                                    <div class="monitor-actions">
-                                        <button class="btn btn-secondary" onclick="editMonitor({{ monitor['id'] }}, '{{ monitor['name'] }}', '{{ monitor['url'] }}', {{ monitor['interval'] }}, {{ monitor['is_active'] }})">
-                                            <i class="fas fa-edit"></i>
-                                        </button>
-                                        <button class="btn btn-danger" onclick="deleteMonitor({{ monitor['id'] }})">
-                                            <i class="fas fa-trash"></i>
-                                        </button>
-                                    </div>
-                                </div>
-                                <div class="monitor-url">{{ monitor['url'] }}</div>
-                                
-                                <div class="monitor-stats">
-                                    <div class="stat-item">
-                                        <div class="stat-value">{{ monitor['up_count'] or 0 }}</div>
-                                        <div class="stat-label">UP</div>
-                                    </div>
-                                    <div class="stat-item">
-                                        <div class="stat-value">{{ monitor['down_count'] or 0 }}</div>
-                                        <div class="stat-label">DOWN</div>
-                                    </div>
-                                    <div class="stat-item">
-                                        <div class="stat-value">
-                                            {% if monitor['avg_response_time'] %}
-                                                {{ "%.2f"|format(monitor['avg_response_time']) }}s
-                                            {% else %}
-                                                -
-                                            {% endif %}
-                                        </div>
-                                        <div class="stat-label">Avg. Response</div>
-                                    </div>
-                                    <div class="stat-item">
-                                        <div class="stat-value">{{ monitor['interval'] }}s</div>
-                                        <div class="stat-label">Interval</div>
-                                    </div>
-                                </div>
-                                
-                                {% if monitor['avg_response_time'] %}
-                                    <div class="response-time">
-                                        <div class="response-time-bar" style="width: {{ [monitor['avg_response_time'] * 100, 100]|min }}%"></div>
-                                    </div>
-                                {% endif %}
-                                
-                                <div class="monitor-actions">
-                                    {% if monitor['is_active'] %}
-                                        <button class="btn btn-secondary" onclick="toggleMonitor({{ monitor['id'] }}, 0)">
-                                            <i class="fas fa-pause"></i> Pause
-                                        </button>
-                                    {% else %}
-                                        <button class="btn btn-success" onclick="toggleMonitor({{ monitor['id'] }}, 1)">
-                                            <i class="fas fa-play"></i> Resume
-                                        </button>
-                                    {% endif %}
-                                    <a href="{{ url_for('monitor_details', monitor_id=monitor['id']) }}" class="btn">
-                                        <i class="fas fa-chart-line"></i> Details
-                                    </a>
-                                </div>
-                            </div>
+                            {{ monitor_card(monitor) }}
                         {% endfor %}
                     </div>
                 {% else %}
                     <div style="text-align: center; padding: 3rem; background: white; border-radius: 10px; box-shadow: 0 5px 15px rgba(0, 0, 0, 0.05);">
                         <h3 style="margin-bottom: 1rem; color: #6c757d;">No monitors yet</h3>
                         <p style="margin-bottom: 1.5rem; color: #6c757d;">Add your first website to start monitoring</p>
-                        <button class="btn" onclick="openAddModal()"><i class="fas fa-plus"></i> Add Monitor</button>
+                        <button class="btn" data-action="open-add"><i class="fas fa-plus"></i> Add Monitor</button>
                     </div>
                 {% endif %}
             </div>
             
+            <!-- Card skeleton for monitors added from another session -->
+            <template id="cardTpl">
+                {{ monitor_card({'id': 0, 'name': '', 'url': '', 'interval': '', 'is_active': 1}) }}
+            </template>
+            
             <!-- Add Monitor Modal -->
             <div id="addModal" class="modal">
                 <div class="modal-content">
                     <div class="modal-header">
                         <div class="modal-title">Add New Monitor</div>
-                        <span class="close-btn" onclick="closeAddModal()">&times;</span>
+                        <span class="close-btn" data-action="close-add">&times;</span>
                     </div>
                     <form id="addMonitorForm" action="{{ url_for('add_monitor') }}" method="POST">
                         <div class="form-group">
@@ -860,19 +1495,20 @@ def dashboard():
                             <input type="number" id="interval" name="interval" min="30" value="60" required>
                         </div>
                         <div class="modal-footer">
-                            <button type="button" class="btn btn-secondary" onclick="closeAddModal()">Cancel</button>
+                            <button type="button" class="btn btn-secondary" data-action="close-add">Cancel</button>
                             <button type="submit" class="btn">Add Monitor</button>
                         </div>
                     </form>
                 </div>
             </div>
             
-            <!-- Edit Monitor Modal -->
+            <!-- Edit Monitor Modal, mounted on first use -->
+            <template id="editModalTpl">
             <div id="editModal" class="modal">
                 <div class="modal-content">
                     <div class="modal-header">
                         <div class="modal-title">Edit Monitor</div>
-                        <span class="close-btn" onclick="closeEditModal()">&times;</span>
+                        <span class="close-btn" data-action="close-edit">&times;</span>
                     </div>
                     <form id="editMonitorForm" action="{{ url_for('edit_monitor') }}" method="POST">
                         <input type="hidden" id="edit_id" name="id">
@@ -894,122 +1530,42 @@ def dashboard():
                             </label>
                         </div>
                         <div class="modal-footer">
-                            <button type="button" class="btn btn-secondary" onclick="closeEditModal()">Cancel</button>
+                            <button type="button" class="btn btn-secondary" data-action="close-edit">Cancel</button>
                             <button type="submit" class="btn">Save Changes</button>
                         </div>
                     </form>
                 </div>
             </div>
+            </template>
             
-            <script>
-                // Modal functions
-                function openAddModal() {
-                    document.getElementById('addModal').style.display = 'flex';
-                }
-                
-                function closeAddModal() {
-                    document.getElementById('addModal').style.display = 'none';
-                }
-                
-                function openEditModal() {
-                    document.getElementById('editModal').style.display = 'flex';
-                }
-                
-                function closeEditModal() {
-                    document.getElementById('editModal').style.display = 'none';
-                }
-                
-                // Edit monitor
-                function editMonitor(id, name, url, interval, isActive) {
-                    document.getElementById('edit_id').value = id;
-                    document.getElementById('edit_name').value = name;
-                    document.getElementById('edit_url').value = url;
-                    document.getElementById('edit_interval').value = interval;
-                    document.getElementById('edit_is_active').checked = isActive === 1;
-                    openEditModal();
-                }
-                
-                // Delete monitor
-                function deleteMonitor(id) {
-                    if (confirm('Are you sure you want to delete this monitor?')) {
-                        fetch('{{ url_for("delete_monitor") }}', {
-                            method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/json',
-                            },
-                            body: JSON.stringify({ id: id }),
-                        })
-                        .then(response => response.json())
-                        .then(data => {
-                            if (data.success) {
-                                location.reload();
-                            } else {
-                                alert('Error deleting monitor');
-                            }
-                        });
-                    }
-                }
-                
-                // Toggle monitor active status
-                function toggleMonitor(id, status) {
-                    fetch('{{ url_for("toggle_monitor") }}', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({ 
-                            id: id,
-                            is_active: status 
-                        }),
-                    })
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.success) {
-                            location.reload();
-                        } else {
-                            alert('Error updating monitor');
-                        }
-                    });
-                }
-            </script>
+            <div id="toast" class="toast" role="status"></div>
         </body>
         </html>
-    ''', monitors=monitors)
+''')
 
-@app.route('/monitor/<int:monitor_id>')
-def monitor_details(monitor_id):
+@app.route('/dashboard')
+def dashboard():
     if 'user_id' not in session:
         return redirect(url_for('login'))
     
     db = get_db()
-    monitor = db.execute('''
-        SELECT m.*, 
-               (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 1) as up_count,
-               (SELECT COUNT(*) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.is_up = 0) as down_count,
-               (SELECT AVG(sc.response_time) FROM status_checks sc WHERE sc.monitor_id = m.id AND sc.response_time IS NOT NULL) as avg_response_time,
-               (SELECT sc.is_up FROM status_checks sc WHERE sc.monitor_id = m.id ORDER BY sc.checked_at DESC LIMIT 1) as last_status
-        FROM monitors m
-        WHERE m.id = ? AND m.user_id = ?
-    ''', (monitor_id, session['user_id'])).fetchone()
-    
-    if not monitor:
-        flash('Monitor not found', 'danger')
-        return redirect(url_for('dashboard'))
-    
-    checks = db.execute('''
-        SELECT * FROM status_checks
-        WHERE monitor_id = ?
-        ORDER BY checked_at DESC
-        LIMIT 50
-    ''', (monitor_id,)).fetchall()
+    monitors = db.execute(MONITOR_STATS_QUERY + '''
+        WHERE m.user_id = ?
+        ORDER BY m.created_at DESC
+    ''', (session['user_id'],)).fetchall()
     
-    return render_template_string('''
+    return render_template(DASHBOARD_TEMPLATE, monitors=monitors)
+
+DETAILS_TEMPLATE = app.jinja_env.from_string('''
         <!DOCTYPE html>
         <html lang="en">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
             <title>StormX - Monitor Details</title>
+            <link rel="preconnect" href="https://fonts.googleapis.com">
+            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+            <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
             <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&display=swap" rel="stylesheet">
             <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
             <style>
@@ -1048,7 +1604,7 @@ def monitor_details(monitor_id):
                     color: white;
                     text-decoration: none;
                     font-weight: 500;
-                    transition: all 0.3s ease;
+                    transition: transform 0.3s ease, opacity 0.3s ease;
                 }
                 .nav-links a:hover {
                     opacity: 0.8;
@@ -1077,13 +1633,27 @@ def monitor_details(monitor_id):
                     color: white;
                     font-weight: 600;
                     cursor: pointer;
-                    transition: all 0.3s ease;
+                    transition: transform 0.3s ease;
                     text-decoration: none;
                     display: inline-block;
+                    position: relative;
+                }
+                /* Hover shadow lives on a pseudo-element so only opacity animates */
+                .btn::after {
+                    content: '';
+                    position: absolute;
+                    inset: 0;
+                    border-radius: inherit;
+                    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+                    opacity: 0;
+                    transition: opacity 0.3s ease;
+                    pointer-events: none;
                 }
                 .btn:hover {
                     transform: translateY(-2px);
-                    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+                }
+                .btn:hover::after {
+                    opacity: 1;
                 }
                 .btn-secondary {
                     background: linear-gradient(135deg, #6c757d 0%, #495057 100%);
@@ -1112,6 +1682,7 @@ def monitor_details(monitor_id):
                     height: 12px;
                     border-radius: 50%;
                     margin-right: 0.5rem;
+                    will-change: transform;  /* pulses forever, keep it on its own layer */
                 }
                 .status-up {
                     background-color: #28a745;
@@ -1124,9 +1695,9 @@ def monitor_details(monitor_id):
                     animation: pulse 2s infinite;
                 }
                 @keyframes pulse {
-                    0% { transform: scale(0.95); }
-                    50% { transform: scale(1.05); }
-                    100% { transform: scale(0.95); }
+                    0% { transform: scale3d(0.95, 0.95, 1); }
+                    50% { transform: scale3d(1.05, 1.05, 1); }
+                    100% { transform: scale3d(0.95, 0.95, 1); }
                 }
                 .monitor-url {
                     color: #6c757d;
@@ -1264,9 +1835,9 @@ def monitor_details(monitor_id):
                             <th>Response Time</th>
                         </tr>
                     </thead>
-                    <tbody>
+                    <tbody id="checksBody" data-checks-url="{{ url_for('monitor_checks', monitor_id=monitor['id']) }}">
                         {% for check in checks %}
-                            <tr>
+                            <tr data-check-id="{{ check['id'] }}">
                                 <td>{{ check['checked_at'] }}</td>
                                 <td>
                                     {% if check['is_up'] == 1 %}
@@ -1289,10 +1860,132 @@ def monitor_details(monitor_id):
                         {% endfor %}
                     </tbody>
                 </table>
+                {% if checks|length == page_size %}
+                    <div id="checksSentinel"></div>
+                {% endif %}
+                <template id="checkRowTpl">
+                    <tr>
+                        <td></td>
+                        <td><span class="status-badge"></span></td>
+                        <td class="response-time-cell"> <div class="response-time-bar"><div class="response-time-fill"></div></div></td>
+                    </tr>
+                </template>
             </div>
+            <script>
+                // Older checks are fetched a page at a time as the end of the table scrolls into view
+                const checksBody = document.getElementById('checksBody');
+                const checksSentinel = document.getElementById('checksSentinel');
+                
+                // Rows are cloned from a parsed skeleton and filled via textContent
+                const checkRowTemplate = document.getElementById('checkRowTpl');
+                
+                function buildCheckRow(check) {
+                    const row = checkRowTemplate.content.firstElementChild.cloneNode(true);
+                    row.dataset.checkId = check.id;
+                    row.cells[0].textContent = check.checked_at;
+                    const badge = row.cells[1].firstElementChild;
+                    if (check.is_up === 1) {
+                        badge.classList.add('status-up-badge');
+                        badge.textContent = 'UP (' + check.status_code + ')';
+                    } else {
+                        badge.classList.add('status-down-badge');
+                        badge.textContent = 'DOWN';
+                    }
+                    const cell = row.cells[2];
+                    if (check.response_time) {
+                        cell.firstChild.textContent = check.response_time.toFixed(2) + 's';
+                        cell.querySelector('.response-time-fill').style.width = Math.min(check.response_time * 100, 100) + '%';
+                    } else {
+                        cell.textContent = '-';
+                    }
+                    return row;
+                }
+                
+                if (checksSentinel) {
+                    let loading = false;
+                    const observer = new IntersectionObserver(entries => {
+                        if (!entries[0].isIntersecting || loading) return;
+                        loading = true;
+                        const before = checksBody.lastElementChild.dataset.checkId;
+                        fetch(checksBody.dataset.checksUrl + '?before=' + before)
+                            .then(response => response.json())
+                            .then(data => {
+                                // A failed reply (e.g. the monitor was deleted elsewhere) ends paging
+                                const checks = data.success ? data.checks : [];
+                                const fragment = document.createDocumentFragment();
+                                checks.forEach(check => fragment.appendChild(buildCheckRow(check)));
+                                checksBody.appendChild(fragment);
+                                if (checks.length < {{ page_size }}) {
+                                    observer.disconnect();
+                                    checksSentinel.remove();
+                                } else {
+                                    // Re-arm so a sentinel that is still visible loads the next page
+                                    observer.unobserve(checksSentinel);
+                                    observer.observe(checksSentinel);
+                                }
+                                loading = false;
+                            })
+                            .catch(error => {
+                                // Network error: try again the next time the sentinel scrolls into view
+                                console.error(error);
+                                loading = false;
+                            });
+                    });
+                    observer.observe(checksSentinel);
+                }
+            </script>
         </body>
         </html>
-    ''', monitor=monitor, checks=checks)
+''')
+
+# Rows per page of check history on the details page
+CHECKS_PAGE_SIZE = 50
+
+@app.route('/monitor/<int:monitor_id>')
+def monitor_details(monitor_id):
+    if 'user_id' not in session:
+        return redirect(url_for('login'))
+    
+    db = get_db()
+    monitor = db.execute(MONITOR_STATS_QUERY + '''
+        WHERE m.id = ? AND m.user_id = ?
+    ''', (monitor_id, session['user_id'])).fetchone()
+    
+    if not monitor:
+        flash('Monitor not found', 'danger')
+        return redirect(url_for('dashboard'))
+    
+    checks = db.execute('''
+        SELECT * FROM status_checks
+        WHERE monitor_id = ?
+        ORDER BY id DESC
+        LIMIT ?
+    ''', (monitor_id, CHECKS_PAGE_SIZE)).fetchall()
+    
+    return render_template(DETAILS_TEMPLATE, monitor=monitor, checks=checks, page_size=CHECKS_PAGE_SIZE)
+
+@app.route('/monitor/<int:monitor_id>/checks')
+def monitor_checks(monitor_id):
+    if 'user_id' not in session:
+        return jsonify({'success': False, 'error': 'Not logged in'})
+    
+    db = get_db()
+    monitor = db.execute('SELECT id FROM monitors WHERE id = ? AND user_id = ?',
+                         (monitor_id, session['user_id'])).fetchone()
+    if not monitor:
+        return jsonify({'success': False, 'error': 'Monitor not found'})
+    
+    # Keyset pagination: the page of checks older than the given check id
+    # (the newest page when no id is given)
+    before = request.args.get('before', 2**63 - 1, type=int)
+    checks = db.execute('''
+        SELECT id, checked_at, is_up, status_code, response_time FROM status_checks
+        WHERE monitor_id = ? AND id < ?
+        ORDER BY id DESC
+        LIMIT ?
+    ''', (monitor_id, before, CHECKS_PAGE_SIZE)).fetchall()
+    
+    return jsonify({'success': True, 'checks': [dict(check) for check in checks]})
 
 @app.route('/add_monitor', methods=['POST'])
 def add_monitor():
@@ -1308,9 +2001,11 @@ def add_monitor():
     
     db = get_db()
     try:
-        db.execute('INSERT INTO monitors (user_id, name, url, interval) VALUES (?, ?, ?, ?)',
-                  (session['user_id'], name, url, interval))
+        cursor = db.execute('INSERT INTO monitors (user_id, name, url, interval) VALUES (?, ?, ?, ?)',
+                            (session['user_id'], name, url, interval))
         db.commit()
+        refresh_snapshot(db, [cursor.lastrowid])
+        monitor_wakeup.set()
         flash('Monitor added successfully!', 'success')
     except sqlite3.IntegrityError:
         flash('Error adding monitor', 'danger')
@@ -1339,6 +2034,11 @@ def edit_monitor():
         flash('Monitor not found', 'danger')
         return redirect(url_for('dashboard'))
     
+    # Saving the form unchanged needs no write, no snapshot refresh and no stream update
+    if (monitor['name'], monitor['url'], monitor['interval'], monitor['is_active']) == (name, url, interval, is_active):
+        flash('Monitor updated successfully!', 'success')
+        return redirect(url_for('dashboard'))
+    
     try:
         db.execute('''
             UPDATE monitors 
@@ -1346,6 +2046,7 @@ def edit_monitor():
             WHERE id = ?
         ''', (name, url, interval, is_active, monitor_id))
         db.commit()
+        refresh_snapshot(db, [monitor['id']])
         flash('Monitor updated successfully!', 'success')
     except sqlite3.IntegrityError:
         flash('Error updating monitor', 'danger')
@@ -1371,6 +2072,7 @@ def delete_monitor():
         db.execute('DELETE FROM status_checks WHERE monitor_id = ?', (monitor_id,))
         db.execute('DELETE FROM monitors WHERE id = ?', (monitor_id,))
         db.commit()
+        refresh_snapshot(db, [monitor['id']])
         return jsonify({'success': True})
     except sqlite3.Error as e:
         return jsonify({'success': False, 'error': str(e)})
@@ -1394,10 +2096,87 @@ def toggle_monitor():
     try:
         db.execute('UPDATE monitors SET is_active = ? WHERE id = ?', (is_active, monitor_id))
         db.commit()
+        refresh_snapshot(db, [monitor['id']])
         return jsonify({'success': True})
     except sqlite3.Error as e:
         return jsonify({'success': False, 'error': str(e)})
 
+# JSON API for scripts and external tools: the signed-in user's monitors with
+# their stats. The dashboard itself gets the same data from /status_updates.
+@app.route('/status')
+def status():
+    if 'user_id' not in session:
+        return jsonify({'success': False, 'error': 'Not logged in'})
+    
+    monitors, _ = get_user_status_revision(session['user_id'])
+    return jsonify({'success': True, 'monitors': monitors})
+
+# Longest a status stream stays silent before sending a keep-alive comment
+SSE_HEARTBEAT = 25
+# Prefix of every stream event id. Revisions restart when the process does, so
+# ids from an earlier run never match and always get a fresh full frame.
+STREAM_BOOT_ID = os.urandom(4).hex()
+
+@app.route('/status_updates')
+def status_updates():
+    if 'user_id' not in session:
+        return jsonify({'success': False, 'error': 'Not logged in'})
+    
+    user_id = session['user_id']
+    last_event_id = request.headers.get('Last-Event-ID')
+    
+    def stream():
+        # Served from the in-memory snapshot. The first frame is the full list;
+        # after that only the fields that changed are sent as "delta" events.
+        # Added or removed monitors resend the full list.
+        # The stream sleeps until the snapshot changes; changes that do not
+        # touch this user's monitors send nothing, and a comment line goes out
+        # after SSE_HEARTBEAT quiet seconds to keep the connection alive.
+        # Each frame's id is the revision of the user's list it brings the
+        # client to; a browser reconnecting with the current id as its
+        # Last-Event-ID already has this state and gets a ': resumed' comment
+        # instead of the full frame, so the response starts right away.
+        last_sent = None
+        last_version = None
+        if last_event_id is not None:
+            version = snapshot_version
+            monitors, revision = get_user_status_revision(user_id)
+            if last_event_id == f'{STREAM_BOOT_ID}-{revision}':
+                last_sent = {m['id']: m for m in monitors}
+                last_version = version
+                yield ': resumed\n\n'
+        last_write = time.monotonic()
+        while True:
+            with snapshot_changed:
+                snapshot_changed.wait_for(lambda: snapshot_version != last_version, SSE_HEARTBEAT)
+            frame = None
+            version = snapshot_version
+            if version != last_version:
+                last_version = version
+                monitors, revision = get_user_status_revision(user_id)
+                current = {m['id']: m for m in monitors}
+                if last_sent is None or current.keys() != last_sent.keys():
+                    frame = f'id: {STREAM_BOOT_ID}-{revision}\ndata: {{"monitors":{get_user_status_json(user_id, monitors, revision)}}}\n\n'
+                else:
+                    deltas = []
+                    for monitor_id, monitor in current.items():
+                        changed = {k: v for k, v in monitor.items() if last_sent[monitor_id].get(k) != v}
+                        if changed:
+                            changed['id'] = monitor_id
+                            deltas.append(changed)
+                    if deltas:
+                        frame = f'event: delta\nid: {STREAM_BOOT_ID}-{revision}\ndata: {app.json.dumps({"monitors": deltas})}\n\n'
+                last_sent = current
+            if frame is None and time.monotonic() - last_write >= SSE_HEARTBEAT:
+                frame = ': keep\n\n'
+            if frame is not None:
+                last_write = time.monotonic()
+                yield frame
+    
+    # Disable caching and proxy buffering so each event reaches the client as it is sent
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/logout')
 def logout():
     session.clear()